@@ -14,117 +14,206 @@
 # ==============================================================================
 
 # Load packages
+import tensorflow as tf
 from tensorflow import keras
-from tensorhub.utilities.activations import relu
+from tensorhub.utilities.precision import use_mixed_precision
+
+# NOTE: All layers in this module are built channels-last (NHWC), the
+# preferred layout for tensor cores and XLA's layout optimizer. Set the
+# Keras image data format to "channels_last" so surrounding layers match.
 
 
 class BasicLayer(keras.layers.Layer):
     """Inception V1 module implemented as a keras layer for feature creation."""
 
-    def __init__(self, activation=relu, name=None):
+    def __init__(self, filters=(64, 96, 128, 16, 32, 32), activation="relu", separable=False, return_pool=False, name=None):
         """Class constructor to initialize variables.
 
         Keyword Arguments:
+            filters {tuple} -- Output widths in the (f1, f3r, f3, f5r, f5, fp) layout shared with ReductionLayer; this class has no reduction or pool-projection convs, so only f1 (1x1 branch), f3 (3x3 branch) and f5 (5x5-equivalent branch) are used. (default: {(64, 96, 128, 16, 32, 32)})
             activation {str} -- Activation to be applied on each convolution. (default: {"relu"})
+            separable {bool} -- Use depthwise separable convolutions for spatial convolutions. (default: {False})
+            return_pool {bool} -- Also return the pooling-branch output so callers stacking modules can reuse it via shared_pool. (default: {False})
             name {str} -- Name associated with this layer. (default: {None})
         """
         if name:
             super(BasicLayer, self).__init__(name=name)
         else:
             super(BasicLayer, self).__init__()
-        self.num_filters = 64
+        self.filters = filters
         self.act = activation
+        self.separable = separable
+        self.return_pool = return_pool
         self.strides = 1
         self.padding = "same"
-
-    def build(self, input_shape):
-        """Lazing building of a layer.
-
-        Arguments:
-            input_shape {tensor} -- Input shape tensor.
-        """
-        self.conv_block_a = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_block_b = keras.layers.Conv2D(self.num_filters, (3, 3), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_block_c = keras.layers.Conv2D(self.num_filters, (5, 5), activation=self.act, strides=self.strides, padding=self.padding)
-        self.maxpool_block = keras.layers.MaxPool2D(pool_size=(3, 3), strides=self.strides, padding=self.padding)
-        self.concatenate = keras.layers.concatenate(axis=-1)
-
-    def call(self, x):
+        self.data_format = "channels_last"
+        self._captured_fns = {}
+        spatial_conv = keras.layers.SeparableConv2D if self.separable else keras.layers.Conv2D
+        self.conv_block_a = keras.layers.Conv2D(self.filters[0], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_block_b = spatial_conv(self.filters[2], (3, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_block_c1 = spatial_conv(self.filters[4], (3, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_block_c2 = spatial_conv(self.filters[4], (3, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.maxpool_block = keras.layers.MaxPool2D(pool_size=(3, 3), strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.act_layer = keras.layers.Activation(self.act)
+        self.concat_layer = keras.layers.Concatenate(axis=-1)
+
+    @tf.function(jit_compile=True)
+    def call(self, x, shared_pool=None):
         """Forward pass of the layer.
 
         Arguments:
             x {tensor} -- Input tensor to the layer.
 
+        Keyword Arguments:
+            shared_pool {tensor} -- Precomputed pooling-branch output from a previous module on the same feature map; when given, this module's pool branch is skipped. (default: {None})
+
         Returns:
-            tensor -- Output tensor from the layer.
+            tensor -- Output tensor from the layer, or a (output, pool branch output) tuple when return_pool is True.
         """
         # Block 1
-        out_a = self.conv_block_a(x)
+        out_a = self.act_layer(self.conv_block_a(x))
         # Block 2
-        out_b = self.conv_block_b(x)
-        # Block 3
-        out_c = self.conv_block_a(x)
+        out_b = self.act_layer(self.conv_block_b(x))
+        # Block 3 (stacked 3x3 convolutions with the receptive field of a 5x5)
+        out_c = self.act_layer(self.conv_block_c2(self.act_layer(self.conv_block_c1(x))))
         # Block 4
-        out_d = self.maxpool_block(x)
+        out_d = shared_pool if shared_pool is not None else self.maxpool_block(x)
         # Combine results from each block
-        output = self.concatenate([out_a, out_b, out_c, out_d])
+        output = self.concat_layer([out_a, out_b, out_c, out_d])
+        if self.return_pool:
+            return output, out_d
         return output
 
+    def get_inference_fn(self, dtype=tf.float32):
+        """Compile the forward pass once for a fixed dtype and any NHWC shape.
+
+        Keyword Arguments:
+            dtype {tf.DType} -- Input dtype; match the active mixed precision policy. (default: {tf.float32})
+
+        Returns:
+            callable -- XLA-compiled forward pass of the layer.
+        """
+        return tf.function(self.call, jit_compile=True, input_signature=[tf.TensorSpec([None, None, None, None], dtype)])
+
+    def capture(self, x_spec):
+        """Trace and cache the compiled forward pass for one fixed input spec.
 
-class ReductionLayer:
+        Arguments:
+            x_spec {tf.TensorSpec} -- Shape/dtype specification of the input tensor.
+
+        Returns:
+            ConcreteFunction -- Cached concrete forward pass for x_spec.
+        """
+        key = (tuple(x_spec.shape.as_list()), x_spec.dtype)
+        if key not in self._captured_fns:
+            self._captured_fns[key] = self.call.get_concrete_function(x_spec)
+        return self._captured_fns[key]
+
+
+class ReductionLayer(keras.layers.Layer):
     """Inception V1 with reduction module implemented as a keras layer for feature creation."""
 
-    def __init__(self, activation=relu, name=None):
+    def __init__(self, filters=(64, 96, 128, 16, 32, 32), activation="relu", separable=False, fused=False, share_reduction=True, return_pool=False, name=None):
         """Class constructor to initialize variables.
 
         Keyword Arguments:
-            activation {str} -- Activation to be applied on each convolution. (default: {relu})
+            filters {tuple} -- Output width per branch as (f1, f3r, f3, f5r, f5, fp): the 1x1 branch, 3x3 reduction, 3x3 branch, 5x5 reduction, 5x5 branch and pool projection. (default: {(64, 96, 128, 16, 32, 32)})
+            activation {str} -- Activation to be applied on each convolution. (default: {"relu"})
+            separable {bool} -- Use depthwise separable convolutions for spatial convolutions. (default: {False})
+            fused {bool} -- Collapse the four branches into a shared 1x1 reduction followed by a single grouped convolution, trading branch-exact semantics for one kernel launch instead of several convs plus a concat. The fused form has no separate branches, so it cannot be combined with separable, return_pool or shared_pool. (default: {False})
+            share_reduction {bool} -- Feed the 3x3 and 5x5 branches from one shared 1x1 reduction, halving that 1x1's MACs and input reads. Only honoured when the reduction widths f3r and f5r match; with diverging widths independent reductions are built so f5r takes effect. (default: {True})
+            return_pool {bool} -- Also return the pooling-branch output so callers stacking modules can reuse it via shared_pool. (default: {False})
             name {str} -- Name associated with this layer. (default: {None})
         """
-        if name:
-            super(ReductionLayer, self).__init__(name=name)
-        else:
-            super(ReductionLayer, self).__init__()
-        self.num_filters = 64
+        if fused and (separable or return_pool):
+            raise ValueError("fused=True collapses the branches into a single grouped conv and cannot be combined with separable=True or return_pool=True.")
+        super(ReductionLayer, self).__init__(name=name)
+        self.filters = filters
         self.act = activation
+        self.separable = separable
+        self.return_pool = return_pool
+        self.fused = fused
+        # Sharing is only meaningful while both reductions have the same width.
+        self.share_reduction = share_reduction and filters[1] == filters[3]
         self.strides = 1
         self.padding = "same"
-
-    def build(self, input_shape):
-        """Lazing building of a layer.
-
-        Arguments:
-            input_shape {tensor} -- Input shape tensor.
-        """
-        self.conv_1a = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides*self.strides, padding=self.padding)
-        self.conv_1b = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1c = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1d = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_3 = keras.layers.Conv2D(self.num_filters, (3, 3), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_5 = keras.layers.Conv2D(self.num_filters, (5, 5), activation=self.act, strides=self.strides, padding=self.padding)
-        self.maxpool_block = keras.layers.MaxPool2D(pool_size=(3, 3), strides=self.strides, padding=self.padding)
-        self.concatenate = keras.layers.concatenate(axis=-1)
-
-    def call(self, x):
+        self.data_format = "channels_last"
+        self._captured_fns = {}
+        if self.fused:
+            self.conv_reduce = keras.layers.Conv2D(4 * self.filters[0], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+            self.conv_group = keras.layers.Conv2D(4 * self.filters[0], (3, 3), groups=4, activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+            self.act_layer = keras.layers.Activation(self.act)
+            return
+        spatial_conv = keras.layers.SeparableConv2D if self.separable else keras.layers.Conv2D
+        self.conv_1a = keras.layers.Conv2D(self.filters[0], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1b = keras.layers.Conv2D(self.filters[1], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        if not self.share_reduction:
+            self.conv_1c = keras.layers.Conv2D(self.filters[3], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1d = keras.layers.Conv2D(self.filters[5], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_3 = spatial_conv(self.filters[2], (3, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_5a = spatial_conv(self.filters[4], (3, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_5b = spatial_conv(self.filters[4], (3, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.maxpool_block = keras.layers.MaxPool2D(pool_size=(3, 3), strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.act_layer = keras.layers.Activation(self.act)
+        self.concat_layer = keras.layers.Concatenate(axis=-1)
+
+    @tf.function(jit_compile=True)
+    def call(self, x, shared_pool=None):
         """Forward pass of the layer.
 
         Arguments:
             x {tensor} -- Input tensor to the layer.
 
+        Keyword Arguments:
+            shared_pool {tensor} -- Precomputed pooling-branch output from a previous module on the same feature map; when given, this module's pool branch is skipped. (default: {None})
+
         Returns:
-            tensor -- Output tensor from the layer.
+            tensor -- Output tensor from the layer, or a (output, pool branch output) tuple when return_pool is True.
         """
+        if self.fused:
+            if shared_pool is not None:
+                raise ValueError("shared_pool is not supported with fused=True; the fused path has no pooling branch.")
+            # Shared reduction, then one grouped conv covers all four branches
+            # with the concat implicit in the output channel axis.
+            reduced = self.act_layer(self.conv_reduce(x))
+            return self.act_layer(self.conv_group(reduced))
         # Block 1
-        out_a = self.conv_1a(x)
+        out_a = self.act_layer(self.conv_1a(x))
         # Block 2
-        out_b_inter = self.conv_1b(x)
-        out_b = self.conv_3(out_b_inter)
-        # Block 3
-        out_c_inter = self.conv_1c(x)
-        out_c = self.conv_5(out_c_inter)
-        # Block 4
-        out_d_inter = self.maxpool_block(x)
-        out_d = self.conv_1d(out_d_inter)
+        out_b_inter = self.act_layer(self.conv_1b(x))
+        out_b = self.act_layer(self.conv_3(out_b_inter))
+        # Block 3 (reuses block 2's reduction unless independent ones were requested)
+        out_c_inter = out_b_inter if self.share_reduction else self.act_layer(self.conv_1c(x))
+        out_c = self.act_layer(self.conv_5b(self.act_layer(self.conv_5a(out_c_inter))))
+        # Block 4 (1x1 reduction first so the pool moves N channels instead of M)
+        out_d = shared_pool if shared_pool is not None else self.maxpool_block(self.act_layer(self.conv_1d(x)))
         # Combine results from each block
-        output = self.concatenate([out_a, out_b, out_c, out_d])
-        return output
\ No newline at end of file
+        output = self.concat_layer([out_a, out_b, out_c, out_d])
+        if self.return_pool:
+            return output, out_d
+        return output
+
+    def get_inference_fn(self, dtype=tf.float32):
+        """Compile the forward pass once for a fixed dtype and any NHWC shape.
+
+        Keyword Arguments:
+            dtype {tf.DType} -- Input dtype; match the active mixed precision policy. (default: {tf.float32})
+
+        Returns:
+            callable -- XLA-compiled forward pass of the layer.
+        """
+        return tf.function(self.call, jit_compile=True, input_signature=[tf.TensorSpec([None, None, None, None], dtype)])
+
+    def capture(self, x_spec):
+        """Trace and cache the compiled forward pass for one fixed input spec.
+
+        Arguments:
+            x_spec {tf.TensorSpec} -- Shape/dtype specification of the input tensor.
+
+        Returns:
+            ConcreteFunction -- Cached concrete forward pass for x_spec.
+        """
+        key = (tuple(x_spec.shape.as_list()), x_spec.dtype)
+        if key not in self._captured_fns:
+            self._captured_fns[key] = self.call.get_concrete_function(x_spec)
+        return self._captured_fns[key]
@@ -14,200 +14,294 @@
 # ==============================================================================
 
 # Load packages
+import tensorflow as tf
 from tensorflow import keras
-from tensorhub.utilities.activations import relu
+from tensorhub.utilities.precision import use_mixed_precision
+
+# NOTE: All layers in this module are built channels-last (NHWC), the
+# preferred layout for tensor cores and XLA's layout optimizer. Set the
+# Keras image data format to "channels_last" so surrounding layers match.
 
 
 class BasicLayer(keras.layers.Layer):
     """Standard Inception V2 layer implemented as a keras layer for feature creation."""
 
-    def __init__(self, num_filters=28, activation=relu, name=None):
+    def __init__(self, filters=(64, 96, 128, 16, 32, 32), activation="relu", separable=False, return_pool=False, name=None):
         """Class constructor to initialize variables.
 
         Keyword Arguments:
-            num_filters {int} -- Number of filters for convolution. (default: {28})
+            filters {tuple} -- Output width per branch as (f1, f3r, f3, f5r, f5, fp): the 1x1 branch, 3x3 reduction, 3x3 branch, 5x5 reduction, 5x5 branch and pool projection. (default: {(64, 96, 128, 16, 32, 32)})
             activation {str} -- Activation to be applied on each convolution. (default: {"relu"})
+            separable {bool} -- Use depthwise separable convolutions for spatial convolutions. (default: {False})
+            return_pool {bool} -- Also return the pooling-branch output so callers stacking modules can reuse it via shared_pool. (default: {False})
             name {str} -- Name associated with this layer. (default: {None})
         """
         if name:
             super(BasicLayer, self).__init__(name=name)
         else:
             super(BasicLayer, self).__init__()
-        self.num_filters = num_filters
+        self.filters = filters
         self.act = activation
+        self.separable = separable
+        self.return_pool = return_pool
         self.strides = 1
         self.padding = "same"
+        self.data_format = "channels_last"
+        self._captured_fns = {}
+        spatial_conv = keras.layers.SeparableConv2D if self.separable else keras.layers.Conv2D
+        self.conv_1a = keras.layers.Conv2D(self.filters[0], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1b = keras.layers.Conv2D(self.filters[1], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1_3b = spatial_conv(self.filters[2], (1, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_3_1b = spatial_conv(self.filters[2], (3, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1c = keras.layers.Conv2D(self.filters[3], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1_3c1 = spatial_conv(self.filters[4], (1, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_3_1c1 = spatial_conv(self.filters[4], (3, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1_3c2 = spatial_conv(self.filters[4], (1, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_3_1c2 = spatial_conv(self.filters[4], (3, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1d = keras.layers.Conv2D(self.filters[5], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.maxpool_layer = keras.layers.MaxPool2D(pool_size=(3, 3), strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.act_layer = keras.layers.Activation(self.act)
+        self.concat_layer = keras.layers.Concatenate(axis=-1)
 
-    def build(self, input_shape):
-        """Lazing building of a layer.
-
-        Arguments:
-            input_shape {tensor} -- Input shape tensor.
-        """
-        self.conv_1a = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides * self.strides, padding=self.padding)
-        self.conv_1b = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_3b = keras.layers.Conv2D(self.num_filters, (3, 3), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1c = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_3c1 = keras.layers.Conv2D(self.num_filters, (3, 3), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_3c2 = keras.layers.Conv2D(self.num_filters, (3, 3), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1d = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.maxpool_layer = keras.layers.MaxPool2D(pool_size=(3, 3), strides=self.strides, padding=self.padding)
-        self.concat_layer = keras.layers.concatenate(axis=-1)
-
-    def call(self, x):
+    @tf.function(jit_compile=True)
+    def call(self, x, shared_pool=None):
         """Forward pass of the layer.
 
         Arguments:
             x {tensor} -- Input tensor to the layer.
 
+        Keyword Arguments:
+            shared_pool {tensor} -- Precomputed pooling-branch output from a previous module on the same feature map; when given, this module's pool branch is skipped. (default: {None})
+
         Returns:
-            tensor -- Output tensor from the layer.
+            tensor -- Output tensor from the layer, or a (output, pool branch output) tuple when return_pool is True.
         """
         # Block 1
-        out_a = self.conv_1a(x)
+        out_a = self.act_layer(self.conv_1a(x))
         # Block 2
-        out_b_inter = self.conv_1b(x)
-        out_b = self.conv_3b(out_b_inter)
+        out_b = self.act_layer(self.conv_3_1b(self.act_layer(self.conv_1_3b(self.act_layer(self.conv_1b(x))))))
         # Block 3
-        out_c_inter = self.conv_1c(x)
-        out_c_inter = self.conv_3c1(out_c_inter)
-        out_c = self.conv_3c2(out_c_inter)
-        # Block 4
-        out_d_inter = self.maxpool_layer(x)
-        out_d = self.conv_1d(out_d_inter)
+        out_c = self.act_layer(self.conv_3_1c2(self.act_layer(self.conv_1_3c2(
+            self.act_layer(self.conv_3_1c1(self.act_layer(self.conv_1_3c1(self.act_layer(self.conv_1c(x))))))))))
+        # Block 4 (1x1 reduction first so the pool moves N channels instead of M)
+        out_d = shared_pool if shared_pool is not None else self.maxpool_layer(self.act_layer(self.conv_1d(x)))
         # Combine results from each block
-        output = self.concat_layer([out_a, out_b, out_c, out_d], axis=-1)
+        output = self.concat_layer([out_a, out_b, out_c, out_d])
+        if self.return_pool:
+            return output, out_d
         return output
 
+    def get_inference_fn(self, dtype=tf.float32):
+        """Compile the forward pass once for a fixed dtype and any NHWC shape.
+
+        Keyword Arguments:
+            dtype {tf.DType} -- Input dtype; match the active mixed precision policy. (default: {tf.float32})
+
+        Returns:
+            callable -- XLA-compiled forward pass of the layer.
+        """
+        return tf.function(self.call, jit_compile=True, input_signature=[tf.TensorSpec([None, None, None, None], dtype)])
+
+    def capture(self, x_spec):
+        """Trace and cache the compiled forward pass for one fixed input spec.
+
+        Arguments:
+            x_spec {tf.TensorSpec} -- Shape/dtype specification of the input tensor.
+
+        Returns:
+            ConcreteFunction -- Cached concrete forward pass for x_spec.
+        """
+        key = (tuple(x_spec.shape.as_list()), x_spec.dtype)
+        if key not in self._captured_fns:
+            self._captured_fns[key] = self.call.get_concrete_function(x_spec)
+        return self._captured_fns[key]
+
 
 class DeepLayer(keras.layers.Layer):
     """Deep Inception V2 layer implemeted as a kaeras layer for feature creation."""
 
-    def __init__(self, num_filters=28, activation=relu, name=None):
+    def __init__(self, filters=(64, 96, 128, 16, 32, 32), activation="relu", separable=False, return_pool=False, name=None):
         """Class constructor to initialize variables.
 
         Keyword Arguments:
-            num_filters {int} -- Number of filters for convolution. (default: {28})
+            filters {tuple} -- Output width per branch as (f1, f3r, f3, f5r, f5, fp): the 1x1 branch, 3x3 reduction, 3x3 branch, 5x5 reduction, 5x5 branch and pool projection. (default: {(64, 96, 128, 16, 32, 32)})
             activation {str} -- Activation to be applied on each convolution. (default: {"relu"})
+            separable {bool} -- Use depthwise separable convolutions for spatial convolutions. (default: {False})
+            return_pool {bool} -- Also return the pooling-branch output so callers stacking modules can reuse it via shared_pool. (default: {False})
             name {str} -- Name associated with this layer. (default: {None})
         """
         if name:
             super(DeepLayer, self).__init__(name=name)
         else:
             super(DeepLayer, self).__init__()
-        self.num_filters = num_filters
+        self.filters = filters
         self.act = activation
+        self.separable = separable
+        self.return_pool = return_pool
         self.strides = 1
         self.padding = "same"
+        self.data_format = "channels_last"
+        self._captured_fns = {}
+        spatial_conv = keras.layers.SeparableConv2D if self.separable else keras.layers.Conv2D
+        self.conv_1a = keras.layers.Conv2D(self.filters[0], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1b = keras.layers.Conv2D(self.filters[1], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1_3b = spatial_conv(self.filters[2], (1, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_3_1b = spatial_conv(self.filters[2], (3, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1c = keras.layers.Conv2D(self.filters[3], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1_3c1 = spatial_conv(self.filters[4], (1, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_3_1c1 = spatial_conv(self.filters[4], (3, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1_3c2 = spatial_conv(self.filters[4], (1, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_3_1c2 = spatial_conv(self.filters[4], (3, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1d = keras.layers.Conv2D(self.filters[5], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.maxpool_layer = keras.layers.MaxPool2D(pool_size=(3, 3), strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.act_layer = keras.layers.Activation(self.act)
+        self.concat_layer = keras.layers.Concatenate(axis=-1)
 
-    def build(self, input_shape):
-        """Lazing building of a layer.
-
-        Arguments:
-            input_shape {tensor} -- Input shape tensor.
-        """
-        self.conv_1a = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides * self.strides, padding=self.padding)
-        self.conv_1b = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1_3b = keras.layers.Conv2D(self.num_filters, (1, 3), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_3_1b = keras.layers.Conv2D(self.num_filters, (3, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1c = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1_3c1 = keras.layers.Conv2D(self.num_filters, (1, 3), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_3_1c1 = keras.layers.Conv2D(self.num_filters, (3, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1_3c2 = keras.layers.Conv2D(self.num_filters, (1, 3), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_3_1c2 = keras.layers.Conv2D(self.num_filters, (3, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1d = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.maxpool_layer = keras.layers.MaxPool2D(pool_size=(3, 3), strides=self.strides, padding=self.padding)
-
-    def call(self, x):
+    @tf.function(jit_compile=True)
+    def call(self, x, shared_pool=None):
         """Forward pass of the layer.
 
         Arguments:
             x {tensor} -- Input tensor to the layer.
 
+        Keyword Arguments:
+            shared_pool {tensor} -- Precomputed pooling-branch output from a previous module on the same feature map; when given, this module's pool branch is skipped. (default: {None})
+
         Returns:
-            tensor -- Output tensor from the layer.
+            tensor -- Output tensor from the layer, or a (output, pool branch output) tuple when return_pool is True.
         """
         # Block 1
-        out_a = self.conv_1a(x)
+        out_a = self.act_layer(self.conv_1a(x))
         # Block 2
-        out_b_inter = self.conv_1b(x)
-        out_b_inter = self.conv_1_3b(out_b_inter)
-        out_b = self.conv_3_1b(out_b_inter)
+        out_b = self.act_layer(self.conv_3_1b(self.act_layer(self.conv_1_3b(self.act_layer(self.conv_1b(x))))))
         # Block 3
-        out_c_inter = self.conv_1c(x)
-        out_c_inter = self.conv_1_3c1(out_c_inter)
-        out_c_inter = self.conv_3_1c1(out_c_inter)
-        out_c_inter = self.conv_1_3c2(out_c_inter)
-        out_c = self.conv_3_1c2(out_c_inter)
-        # Block 4
-        out_d_inter = self.maxpool_layer(x)
-        out_d = self.conv_1d(out_d_inter)
+        out_c = self.act_layer(self.conv_3_1c2(self.act_layer(self.conv_1_3c2(
+            self.act_layer(self.conv_3_1c1(self.act_layer(self.conv_1_3c1(self.act_layer(self.conv_1c(x))))))))))
+        # Block 4 (1x1 reduction first so the pool moves N channels instead of M)
+        out_d = shared_pool if shared_pool is not None else self.maxpool_layer(self.act_layer(self.conv_1d(x)))
         # Combine results from each block
-        output = keras.layers.concatenate([out_a, out_b, out_c, out_d], axis=-1)
+        output = self.concat_layer([out_a, out_b, out_c, out_d])
+        if self.return_pool:
+            return output, out_d
         return output
 
+    def get_inference_fn(self, dtype=tf.float32):
+        """Compile the forward pass once for a fixed dtype and any NHWC shape.
+
+        Keyword Arguments:
+            dtype {tf.DType} -- Input dtype; match the active mixed precision policy. (default: {tf.float32})
+
+        Returns:
+            callable -- XLA-compiled forward pass of the layer.
+        """
+        return tf.function(self.call, jit_compile=True, input_signature=[tf.TensorSpec([None, None, None, None], dtype)])
+
+    def capture(self, x_spec):
+        """Trace and cache the compiled forward pass for one fixed input spec.
+
+        Arguments:
+            x_spec {tf.TensorSpec} -- Shape/dtype specification of the input tensor.
+
+        Returns:
+            ConcreteFunction -- Cached concrete forward pass for x_spec.
+        """
+        key = (tuple(x_spec.shape.as_list()), x_spec.dtype)
+        if key not in self._captured_fns:
+            self._captured_fns[key] = self.call.get_concrete_function(x_spec)
+        return self._captured_fns[key]
+
 
 class WideLayer(keras.layers.Layer):
     """Wide Inception V2 layer implemented as a keras layer for feature creation."""
 
-    def __init__(self, num_filters=28, activation=relu, name=None):
+    def __init__(self, filters=(64, 96, 128, 16, 32, 32), activation="relu", separable=False, return_pool=False, name=None):
         """Class constructor to initialize variables.
 
         Keyword Arguments:
-            num_filters {int} -- Number of filters for convolution. (default: {28})
+            filters {tuple} -- Output width per branch as (f1, f3r, f3, f5r, f5, fp): the 1x1 branch, 3x3 reduction, 3x3 branch, 5x5 reduction, 5x5 branch and pool projection. (default: {(64, 96, 128, 16, 32, 32)})
             activation {str} -- Activation to be applied on each convolution. (default: {"relu"})
+            separable {bool} -- Use depthwise separable convolutions for spatial convolutions. (default: {False})
+            return_pool {bool} -- Also return the pooling-branch output so callers stacking modules can reuse it via shared_pool. (default: {False})
             name {str} -- Name associated with this layer. (default: {None})
         """
         if name:
             super(WideLayer, self).__init__(name=name)
         else:
             super(WideLayer, self).__init__()
-        self.num_filters = num_filters
+        self.filters = filters
         self.act = activation
+        self.separable = separable
+        self.return_pool = return_pool
         self.strides = 1
         self.padding = "same"
+        self.data_format = "channels_last"
+        self._captured_fns = {}
+        spatial_conv = keras.layers.SeparableConv2D if self.separable else keras.layers.Conv2D
+        self.conv_1a = keras.layers.Conv2D(self.filters[0], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1b = keras.layers.Conv2D(self.filters[1], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1_3b = spatial_conv(self.filters[2], (1, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_3_1b = spatial_conv(self.filters[2], (3, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1c = keras.layers.Conv2D(self.filters[3], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_3c = spatial_conv(self.filters[4], (3, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1_3c = spatial_conv(self.filters[4], (1, 3), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_3_1c = spatial_conv(self.filters[4], (3, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.conv_1d = keras.layers.Conv2D(self.filters[5], (1, 1), activation=None, strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.maxpool_layer = keras.layers.MaxPool2D(pool_size=(3, 3), strides=self.strides, padding=self.padding, data_format=self.data_format)
+        self.act_layer = keras.layers.Activation(self.act)
+        self.concat_layer = keras.layers.Concatenate(axis=-1)
 
-    def build(self, input_shape):
-        """Lazing building of a layer.
-
-        Arguments:
-            input_shape {tensor} -- Input shape tensor.
-        """
-        self.conv_1a = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides * self.strides, padding=self.padding)
-        self.conv_1b = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1_3b = keras.layers.Conv2D(self.num_filters, (1, 3), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_3_1b = keras.layers.Conv2D(self.num_filters, (3, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1c = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_3c = keras.layers.Conv2D(self.num_filters, (3, 3), activation=self.act,strides=self.strides, padding=self.padding)
-        self.conv_1_3c = keras.layers.Conv2D(self.num_filters, (1, 3), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_3_1c = keras.layers.Conv2D(self.num_filters, (3, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.conv_1d = keras.layers.Conv2D(self.num_filters, (1, 1), activation=self.act, strides=self.strides, padding=self.padding)
-        self.maxpool_layer = keras.layers.MaxPool2D(pool_size=(3, 3), strides=self.strides, padding=self.padding)
-        self.concat_layer = keras.layers.concatenate(axis=-1)
-
-    def call(self, x):
+    @tf.function(jit_compile=True)
+    def call(self, x, shared_pool=None):
         """Forward pass of the layer.
 
         Arguments:
             x {tensor} -- Input tensor to the layer.
 
+        Keyword Arguments:
+            shared_pool {tensor} -- Precomputed pooling-branch output from a previous module on the same feature map; when given, this module's pool branch is skipped. (default: {None})
+
         Returns:
-            tensor -- Output tensor from the layer.
+            tensor -- Output tensor from the layer, or a (output, pool branch output) tuple when return_pool is True.
         """
         # Block 1
-        out_a = self.conv_1a(x)
+        out_a = self.act_layer(self.conv_1a(x))
         # Block 2
-        out_b_inter = self.conv_1b(x)
-        out_b1 = self.conv_1_3b(out_b_inter)
-        out_b2 = self.conv_3_1b(out_b_inter)
+        out_b_inter = self.act_layer(self.conv_1b(x))
+        out_b1 = self.act_layer(self.conv_1_3b(out_b_inter))
+        out_b2 = self.act_layer(self.conv_3_1b(out_b_inter))
         # Block 3
-        out_c_inter = self.conv_1c(x)
-        out_c_inter = self.conv_3c(out_c_inter)
-        out_c1 = self.conv_1_3c(out_c_inter)
-        out_c2 = self.conv_3_1c(out_c_inter)
-        # Block 4
-        out_d_inter = self.maxpool_layer(x)
-        out_d = self.conv_1d(out_d_inter)
+        out_c_inter = self.act_layer(self.conv_3c(self.act_layer(self.conv_1c(x))))
+        out_c1 = self.act_layer(self.conv_1_3c(out_c_inter))
+        out_c2 = self.act_layer(self.conv_3_1c(out_c_inter))
+        # Block 4 (1x1 reduction first so the pool moves N channels instead of M)
+        out_d = shared_pool if shared_pool is not None else self.maxpool_layer(self.act_layer(self.conv_1d(x)))
         # Combine results from each block
-        output = self.concat_layer([out_a, out_b1, out_b2, out_c1, out_c1, out_d], axis=-1)
-        return output
\ No newline at end of file
+        output = self.concat_layer([out_a, out_b1, out_b2, out_c1, out_c2, out_d])
+        if self.return_pool:
+            return output, out_d
+        return output
+
+    def get_inference_fn(self, dtype=tf.float32):
+        """Compile the forward pass once for a fixed dtype and any NHWC shape.
+
+        Keyword Arguments:
+            dtype {tf.DType} -- Input dtype; match the active mixed precision policy. (default: {tf.float32})
+
+        Returns:
+            callable -- XLA-compiled forward pass of the layer.
+        """
+        return tf.function(self.call, jit_compile=True, input_signature=[tf.TensorSpec([None, None, None, None], dtype)])
+
+    def capture(self, x_spec):
+        """Trace and cache the compiled forward pass for one fixed input spec.
+
+        Arguments:
+            x_spec {tf.TensorSpec} -- Shape/dtype specification of the input tensor.
+
+        Returns:
+            ConcreteFunction -- Cached concrete forward pass for x_spec.
+        """
+        key = (tuple(x_spec.shape.as_list()), x_spec.dtype)
+        if key not in self._captured_fns:
+            self._captured_fns[key] = self.call.get_concrete_function(x_spec)
+        return self._captured_fns[key]
@@ -0,0 +1,30 @@
+# Copyright 2019 The TensorHub Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+# Load packages
+from tensorflow.keras import mixed_precision
+
+
+def use_mixed_precision(dtype="mixed_float16"):
+    """Run layers under a mixed precision policy.
+
+    Layers constructed after this call compute in float16/bfloat16 while
+    keeping float32 variables, halving activation bandwidth and enabling
+    tensor core throughput on convolution branches.
+
+    Keyword Arguments:
+        dtype {str} -- Mixed precision policy. Use "mixed_bfloat16" on TPU/Ampere+. (default: {"mixed_float16"})
+    """
+    mixed_precision.set_global_policy(dtype)